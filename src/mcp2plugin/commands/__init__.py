@@ -0,0 +1 @@
+"""CLI command implementations, loaded on demand by `cli.main`."""
@@ -0,0 +1,98 @@
+"""Shared helpers for CLI commands."""
+
+import os
+from contextlib import nullcontext
+from pathlib import Path
+
+import click
+
+# Heavy dependencies (rich, httpx, Gemini) are imported inside the command
+# bodies that need them to keep `--help` and `list` startup fast.
+_console_instance = None
+
+
+def get_console():
+    """Get the shared rich Console, creating it on first use."""
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+
+        _console_instance = Console()
+    return _console_instance
+
+
+def load_env() -> None:
+    """Load environment variables from .env (only commands that read env need this)."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+def is_interactive(console) -> bool:
+    """Whether to use Rich's live/decorated output (TTY and not quiet)."""
+    return console.is_terminal and not os.getenv("MCP2PLUGIN_QUIET")
+
+
+def status(console, message: str):
+    """Show a spinner while working, or do nothing when not interactive."""
+    if is_interactive(console):
+        return console.status(message, spinner="dots")
+    return nullcontext()
+
+
+def print_panel(console, body: str, title: str, border_style: str) -> None:
+    """Print a Rich panel, or its plain text when not interactive."""
+    if not is_interactive(console):
+        from rich.text import Text
+
+        click.echo(Text.from_markup(body).plain)
+        return
+
+    from rich.panel import Panel
+
+    console.print(Panel(body, title=title, border_style=border_style))
+
+
+def print_table(
+    console,
+    title: str,
+    columns: list[tuple[str, str | None]],
+    rows: list[tuple[str, ...]],
+    show_header: bool = True,
+) -> None:
+    """Print a Rich table, or tab-separated rows when not interactive.
+
+    Args:
+        console: Rich console
+        title: Table title
+        columns: (name, style) pairs
+        rows: Row values (may contain Rich markup)
+        show_header: Whether to show the column header
+    """
+    if not is_interactive(console):
+        from rich.text import Text
+
+        if show_header:
+            click.echo("\t".join(name for name, _ in columns))
+        for row in rows:
+            click.echo("\t".join(Text.from_markup(value).plain for value in row))
+        return
+
+    from rich.table import Table
+
+    table = Table(title=title, show_header=show_header)
+    for name, style in columns:
+        table.add_column(name, style=style)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+
+
+def get_default_output_dir() -> Path:
+    """Get the default output directory (plugins/ in current directory)."""
+    return Path.cwd() / "plugins"
+
+
+def get_default_marketplace_path() -> Path:
+    """Get the default marketplace path (current directory)."""
+    return Path.cwd()
@@ -0,0 +1,180 @@
+"""Commands for converting MCP servers to plugins."""
+
+from pathlib import Path
+
+import click
+
+from .common import (
+    get_console,
+    get_default_marketplace_path,
+    get_default_output_dir,
+    load_env,
+    print_panel,
+    print_table,
+    status,
+)
+
+
+@click.command()
+@click.argument("url")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Output directory for the plugin (default: ./plugins)",
+)
+@click.option(
+    "--no-llm",
+    is_flag=True,
+    help="Disable LLM enhancement (faster, but less accurate)",
+)
+@click.option(
+    "--priority",
+    is_flag=True,
+    help="Generate the plugin description on Gemini's priority tier (lower latency, higher cost)",
+)
+def convert(url: str, output: Path | None, no_llm: bool, priority: bool):
+    """Convert an MCP URL to a Claude Code plugin.
+
+    URL should be from fastmcp.me or smithery.ai:
+
+    \b
+    Examples:
+      mcp2plugin convert https://fastmcp.me/MCP/Details/217/repomix
+      mcp2plugin convert https://smithery.ai/server/slack
+    """
+    import asyncio
+
+    from ..core import Converter
+
+    load_env()
+    console = get_console()
+    output_dir = output or get_default_output_dir()
+    marketplace_path = output_dir.parent if output else get_default_marketplace_path()
+
+    async def run() -> Path:
+        async with Converter(
+            output_dir=output_dir,
+            marketplace_path=marketplace_path,
+            use_llm=not no_llm,
+            description_service_tier="priority" if priority else None,
+        ) as converter:
+            return await converter.convert(url)
+
+    with status(console, "[bold blue]Converting MCP to plugin..."):
+        try:
+            plugin_path = asyncio.run(run())
+        except Exception as e:
+            console.print(f"[bold red]Error:[/] {e}")
+            raise SystemExit(1)
+
+    print_panel(
+        console,
+        f"[bold green]Plugin created successfully![/]\n\n"
+        f"Location: [cyan]{plugin_path}[/]\n\n"
+        f"To use in Claude Code:\n"
+        f"  1. Add marketplace: [yellow]/plugin marketplace add {marketplace_path}[/]\n"
+        f"  2. Install plugin: [yellow]/plugin install {plugin_path.name}@mcp2plugin-marketplace[/]",
+        title="Success",
+        border_style="green",
+    )
+
+
+@click.command("convert-many")
+@click.argument("urls", nargs=-1)
+@click.option(
+    "--from-file",
+    "-f",
+    type=click.File("r", encoding="utf-8"),
+    default=None,
+    help="Read URLs from a file (one per line, '#' starts a comment)",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Output directory for the plugins (default: ./plugins)",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help="Maximum number of conversions running at once",
+)
+@click.option(
+    "--no-llm",
+    is_flag=True,
+    help="Disable LLM enhancement (faster, but less accurate)",
+)
+def convert_many(
+    urls: tuple[str, ...],
+    from_file,
+    output: Path | None,
+    concurrency: int,
+    no_llm: bool,
+):
+    """Convert several MCP URLs to Claude Code plugins concurrently.
+
+    \b
+    Examples:
+      mcp2plugin convert-many https://fastmcp.me/MCP/Details/217/repomix https://smithery.ai/server/slack
+      mcp2plugin convert-many --from-file urls.txt --concurrency 4
+    """
+    import asyncio
+
+    from ..core import Converter
+
+    load_env()
+    console = get_console()
+
+    all_urls = list(urls)
+    if from_file:
+        for line in from_file:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                all_urls.append(line)
+
+    if not all_urls:
+        raise click.UsageError("Provide at least one URL or --from-file.")
+
+    output_dir = output or get_default_output_dir()
+    marketplace_path = output_dir.parent if output else get_default_marketplace_path()
+
+    async def run() -> list[Path | BaseException]:
+        async with Converter(
+            output_dir=output_dir,
+            marketplace_path=marketplace_path,
+            use_llm=not no_llm,
+            # Batch runs are not latency sensitive; use the discounted tier
+            service_tier="flex",
+        ) as converter:
+            return await converter.convert_many(all_urls, concurrency=concurrency)
+
+    with status(console, f"[bold blue]Converting {len(all_urls)} MCP servers..."):
+        try:
+            results = asyncio.run(run())
+        except Exception as e:
+            console.print(f"[bold red]Error:[/] {e}")
+            raise SystemExit(1)
+
+    rows = []
+    failed = 0
+    for url, result in zip(all_urls, results):
+        if isinstance(result, BaseException):
+            failed += 1
+            rows.append((url, f"[red]{result}[/]"))
+        else:
+            rows.append((url, f"[green]{result.name}[/]"))
+
+    print_table(console, "Conversion Results", [("URL", None), ("Result", None)], rows)
+    console.print(
+        f"\n[bold]{len(all_urls) - failed} converted, {failed} failed.[/]\n"
+        f"To use in Claude Code: [yellow]/plugin marketplace add {marketplace_path}[/]"
+    )
+
+    if failed:
+        raise SystemExit(1)
@@ -0,0 +1,74 @@
+"""Command for showing MCP information."""
+
+import click
+
+from .common import get_console, get_default_output_dir, print_table, status
+
+
+@click.command()
+@click.argument("url")
+def info(url: str):
+    """Show MCP information without converting.
+
+    \b
+    Examples:
+      mcp2plugin info https://fastmcp.me/MCP/Details/217/repomix
+    """
+    import asyncio
+
+    from ..core import Converter
+
+    console = get_console()
+
+    async def run():
+        async with Converter(
+            output_dir=get_default_output_dir(),
+            use_llm=False,
+        ) as converter:
+            return await converter.get_info(url)
+
+    with status(console, "[bold blue]Fetching MCP info..."):
+        try:
+            mcp_info = asyncio.run(run())
+        except Exception as e:
+            console.print(f"[bold red]Error:[/] {e}")
+            raise SystemExit(1)
+
+    # Display info
+    rows = [
+        ("Name", mcp_info.name),
+        ("Description", mcp_info.description or "(none)"),
+        ("Author", mcp_info.author or "(unknown)"),
+        ("Connection", mcp_info.connection_type),
+    ]
+
+    if mcp_info.install_command:
+        install_cmd = f"{mcp_info.install_command} {' '.join(mcp_info.install_args)}"
+        rows.append(("Install", install_cmd))
+
+    if mcp_info.http_url:
+        rows.append(("URL", mcp_info.http_url))
+
+    if mcp_info.env_vars:
+        rows.append(("Env Vars", ", ".join(mcp_info.env_vars)))
+
+    if mcp_info.homepage:
+        rows.append(("Homepage", mcp_info.homepage))
+
+    rows.append(("Tools", str(len(mcp_info.tools))))
+
+    print_table(
+        console,
+        f"MCP: {mcp_info.name}",
+        [("Field", "cyan"), ("Value", None)],
+        rows,
+        show_header=False,
+    )
+
+    if mcp_info.tools:
+        console.print("\n[bold]Tools:[/]")
+        for tool in mcp_info.tools[:10]:
+            desc = f" - {tool.description}" if tool.description else ""
+            console.print(f"  • [cyan]{tool.name}[/]{desc}")
+        if len(mcp_info.tools) > 10:
+            console.print(f"  ... and {len(mcp_info.tools) - 10} more")
@@ -0,0 +1,53 @@
+"""Command for initializing a marketplace."""
+
+from pathlib import Path
+
+import click
+
+from .common import get_console, get_default_marketplace_path, print_panel
+
+
+@click.command()
+@click.option(
+    "--marketplace",
+    "-m",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Marketplace directory (default: current directory)",
+)
+@click.option(
+    "--name",
+    default="mcp2plugin-marketplace",
+    help="Marketplace name",
+)
+@click.option(
+    "--owner",
+    default="mcp2plugin",
+    help="Marketplace owner name",
+)
+def init(marketplace: Path | None, name: str, owner: str):
+    """Initialize marketplace in current directory."""
+    from ..core import Marketplace
+
+    console = get_console()
+    marketplace_path = marketplace or get_default_marketplace_path()
+
+    mp = Marketplace(marketplace_path)
+    mp.initialize(name=name, owner_name=owner)
+
+    # Create plugins directory
+    plugins_dir = marketplace_path / "plugins"
+    plugins_dir.mkdir(exist_ok=True)
+
+    print_panel(
+        console,
+        f"[bold green]Marketplace initialized![/]\n\n"
+        f"Location: [cyan]{marketplace_path}[/]\n"
+        f"Config: [cyan]{mp.config_path}[/]\n"
+        f"Plugins: [cyan]{plugins_dir}[/]\n\n"
+        f"Next steps:\n"
+        f"  1. Convert MCP: [yellow]mcp2plugin convert <url>[/]\n"
+        f"  2. Add to Claude Code: [yellow]/plugin marketplace add {marketplace_path}[/]",
+        title="Success",
+        border_style="green",
+    )
@@ -0,0 +1,55 @@
+"""Command for listing marketplace plugins."""
+
+from pathlib import Path
+
+import click
+
+from .common import get_console, get_default_marketplace_path, print_table
+
+
+@click.command("list")
+@click.option(
+    "--marketplace",
+    "-m",
+    type=click.Path(exists=True, path_type=Path),
+    default=None,
+    help="Marketplace directory (default: current directory)",
+)
+def list_plugins(marketplace: Path | None):
+    """List plugins in the marketplace."""
+    from ..core import Marketplace
+
+    console = get_console()
+    marketplace_path = marketplace or get_default_marketplace_path()
+    mp = Marketplace(marketplace_path)
+
+    plugins = mp.list_plugins()
+
+    if not plugins:
+        console.print("[yellow]No plugins in marketplace.[/]")
+        console.print(
+            f"\nConvert an MCP server to add plugins:\n"
+            f"  [cyan]mcp2plugin convert https://fastmcp.me/MCP/Details/217/repomix[/]"
+        )
+        return
+
+    rows = [
+        (
+            plugin["name"],
+            plugin.get("description", "")[:50] + "..." if len(plugin.get("description", "")) > 50 else plugin.get("description", ""),
+            plugin.get("source", ""),
+        )
+        for plugin in plugins
+    ]
+
+    print_table(
+        console,
+        "Marketplace Plugins",
+        [("Name", "cyan"), ("Description", None), ("Source", None)],
+        rows,
+    )
+    console.print(
+        f"\nTo install a plugin in Claude Code:\n"
+        f"  [yellow]/plugin marketplace add {marketplace_path}[/]\n"
+        f"  [yellow]/plugin install <name>@mcp2plugin-marketplace[/]"
+    )
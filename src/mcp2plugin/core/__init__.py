@@ -1,7 +1,34 @@
 """Core conversion and generation modules."""
 
-from .converter import Converter
-from .plugin_generator import PluginGenerator
-from .marketplace import Marketplace
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .converter import Converter
+    from .marketplace import Marketplace
+    from .plugin_generator import PluginGenerator
 
 __all__ = ["Converter", "PluginGenerator", "Marketplace"]
+
+# Submodules are imported on first attribute access (PEP 562) so that
+# `from .core import Marketplace` does not pull in the converter's
+# httpx/Gemini import chain.
+_LAZY_ATTRS = {
+    "Converter": ".converter",
+    "PluginGenerator": ".plugin_generator",
+    "Marketplace": ".marketplace",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -1,7 +1,9 @@
 """Main conversion orchestrator."""
 
+import asyncio
 import os
 from pathlib import Path
+from urllib.parse import urlparse
 
 import httpx
 
@@ -30,6 +32,8 @@ class Converter:
         marketplace_path: Path | None = None,
         gemini_api_key: str | None = None,
         use_llm: bool = True,
+        service_tier: str | None = None,
+        description_service_tier: str | None = None,
     ):
         """Initialize the converter.
 
@@ -38,6 +42,10 @@ class Converter:
             marketplace_path: Path to marketplace root (defaults to output_dir parent)
             gemini_api_key: Gemini API key (optional, uses env var)
             use_llm: Whether to use LLM for enhanced parsing
+            service_tier: Gemini service tier for LLM requests (defaults to
+                the API's standard tier)
+            description_service_tier: Gemini service tier for plugin
+                description generation (defaults to the parser's tier)
         """
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -48,18 +56,36 @@ class Converter:
 
         self.generator = PluginGenerator(output_dir)
 
+        self._client: httpx.AsyncClient | None = None
+
         self.use_llm = use_llm
+        self.description_service_tier = description_service_tier
         self.gemini_parser = None
         if use_llm:
             api_key = gemini_api_key or os.getenv("GEMINI_API_KEY")
             if api_key:
-                self.gemini_parser = GeminiParser(api_key)
+                self.gemini_parser = GeminiParser(api_key, service_tier=service_tier)
 
         # Initialize source parsers
         self.sources: list[MCPSource] = [
             FastMCPSource(),
             SmitherySource(),
         ]
+        # Source that last handled each host, to skip re-probing
+        self._source_by_host: dict[str, MCPSource] = {}
+
+    async def __aenter__(self) -> "Converter":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and the sources' resources."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        await asyncio.gather(*(source.aclose() for source in self.sources))
 
     async def convert(self, url: str) -> Path:
         """Convert an MCP URL to a Claude Code plugin.
@@ -87,43 +113,110 @@ class Converter:
             )
 
         # Find appropriate source parser
-        source = self._get_source(url)
+        source = await self._get_source(url)
         if not source:
             raise ConversionError(f"No parser available for URL: {url}")
 
-        # Fetch MCP information
+        use_llm = bool(self.gemini_parser and self.use_llm)
+
+        # Fetch MCP information, and the raw page for the LLM concurrently
+        html_task = asyncio.create_task(self._fetch_html(url)) if use_llm else None
         try:
             mcp_info = await source.fetch(url)
         except httpx.HTTPError as e:
+            self._cancel(html_task)
             raise ConversionError(f"Failed to fetch URL: {e}") from e
         except Exception as e:
+            self._cancel(html_task)
             raise ConversionError(f"Failed to parse MCP page: {e}") from e
 
-        # Enhance with LLM if available
-        if self.gemini_parser and self.use_llm:
+        # Skip the LLM (and the raw page) when the source already has everything
+        html_content = None
+        if html_task is not None:
+            if mcp_info.is_complete():
+                self._cancel(html_task)
+            else:
+                try:
+                    html_content = await html_task
+                except Exception:
+                    html_content = None
+
+        # Enhance with LLM if available (skipped if the raw page fetch failed)
+        if html_content is not None:
             try:
-                html_content = await self._fetch_html(url)
-                mcp_info = await self.gemini_parser.enhance_mcp_info(mcp_info, html_content)
-
-                # Generate better description if needed
-                if not mcp_info.description or len(mcp_info.description) < 20:
-                    mcp_info.description = await self.gemini_parser.generate_plugin_description(
-                        mcp_info.name,
-                        mcp_info.tools,
-                        mcp_info.description,
+                if self._needs_description(mcp_info) and mcp_info.tools:
+                    # Enhancement only fills in a missing description or tool
+                    # list, so when the source already has tools, generate a
+                    # replacement for its short description alongside it
+                    # rather than afterwards.
+                    enhanced, description = await asyncio.gather(
+                        self.gemini_parser.enhance_mcp_info(mcp_info, html_content),
+                        self.gemini_parser.generate_plugin_description(
+                            mcp_info.name,
+                            mcp_info.tools,
+                            mcp_info.description,
+                            service_tier=self.description_service_tier,
+                        ),
+                        return_exceptions=True,
                     )
+                    if isinstance(enhanced, BaseException):
+                        raise enhanced
+                    mcp_info = enhanced
+
+                    # Prefer the enhanced description when it is long enough
+                    if self._needs_description(mcp_info) and isinstance(description, str):
+                        mcp_info.description = description
+                else:
+                    mcp_info = await self.gemini_parser.enhance_mcp_info(mcp_info, html_content)
+
+                    # Generate better description if needed, from the
+                    # enhanced tool list
+                    if self._needs_description(mcp_info):
+                        generate = self.gemini_parser.generate_plugin_description
+                        mcp_info.description = await generate(
+                            mcp_info.name,
+                            mcp_info.tools,
+                            mcp_info.description,
+                            service_tier=self.description_service_tier,
+                        )
             except Exception:
                 # Continue without LLM enhancement
                 pass
 
         # Generate plugin
-        plugin_path = self.generator.generate(mcp_info)
+        plugin_path = await self.generator.agenerate(mcp_info)
 
         # Add to marketplace
-        self.marketplace.add_plugin(plugin_path, mcp_info)
+        await self.marketplace.aadd_plugin(plugin_path, mcp_info)
 
         return plugin_path
 
+    async def convert_many(
+        self, urls: list[str], concurrency: int = 8
+    ) -> list[Path | BaseException]:
+        """Convert several MCP URLs concurrently.
+
+        Args:
+            urls: URLs of the MCP server pages
+            concurrency: Maximum number of conversions in flight at once
+
+        Returns:
+            One entry per URL, in input order: the generated plugin path, or
+            the exception that made that conversion fail
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def convert_one(url: str) -> Path:
+            async with semaphore:
+                return await self.convert(url)
+
+        # Collect all marketplace updates and write marketplace.json once
+        with self.marketplace.session():
+            return await asyncio.gather(
+                *(convert_one(url) for url in urls),
+                return_exceptions=True,
+            )
+
     async def get_info(self, url: str) -> MCPInfo:
         """Get MCP information without generating a plugin.
 
@@ -135,22 +228,71 @@ class Converter:
         """
         url = normalize_url(url)
 
-        source = self._get_source(url)
+        source = await self._get_source(url)
         if not source:
             raise ConversionError(f"No parser available for URL: {url}")
 
         return await source.fetch(url)
 
-    def _get_source(self, url: str) -> MCPSource | None:
-        """Get the appropriate source parser for a URL."""
-        for source in self.sources:
-            if source.can_handle(url):
+    @staticmethod
+    def _cancel(task: asyncio.Task | None) -> None:
+        """Cancel a background task that is no longer needed."""
+        if task is None:
+            return
+        if task.done():
+            # Mark a failure as retrieved so asyncio doesn't log it
+            if not task.cancelled():
+                task.exception()
+        else:
+            task.cancel()
+
+    @staticmethod
+    def _needs_description(mcp_info: MCPInfo) -> bool:
+        """Whether the description is too short to use as-is."""
+        return not mcp_info.description or len(mcp_info.description) < 20
+
+    async def _get_source(self, url: str) -> MCPSource | None:
+        """Get the appropriate source parser for a URL.
+
+        All sources are probed concurrently; the first one (in `self.sources`
+        order) that accepts the URL wins and is remembered for its host.
+        """
+        host = urlparse(url).netloc
+        cached = self._source_by_host.get(host)
+        if cached is not None and cached.can_handle(url):
+            return cached
+
+        tasks = [asyncio.create_task(s.can_handle_async(url)) for s in self.sources]
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        for source, handled in zip(self.sources, results):
+            if handled:
+                self._source_by_host[host] = source
                 return source
         return None
 
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps connections (and TLS sessions) alive across
+        requests for the lifetime of the converter.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                follow_redirects=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=10),
+            )
+        return self._client
+
     async def _fetch_html(self, url: str) -> str:
         """Fetch HTML content from URL."""
-        async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            return response.text
+        client = await self._get_client()
+        response = await client.get(url)
+        response.raise_for_status()
+        return response.text
@@ -1,8 +1,14 @@
 """Marketplace management for converted plugins."""
 
-import json
+import asyncio
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
+import orjson
+
 from ..models import (
     MCPInfo,
     MarketplaceConfig,
@@ -23,6 +29,11 @@ class Marketplace:
         self.path = marketplace_path
         self.config_dir = marketplace_path / ".claude-plugin"
         self.config_path = self.config_dir / "marketplace.json"
+        self._session: MarketplaceConfig | None = None
+        # Plugin name -> position in self._session.plugins
+        self._session_index: dict[str, int] = {}
+        # Serializes mutations from worker threads (see aadd_plugin)
+        self._lock = threading.RLock()
 
     def initialize(
         self,
@@ -48,6 +59,31 @@ class Marketplace:
             )
             self._save_config(config)
 
+    @contextmanager
+    def session(self) -> Iterator[MarketplaceConfig]:
+        """Batch several changes into a single load and save.
+
+        Inside the block, `add_plugin` and `remove_plugin` mutate the loaded
+        configuration in memory; it is written once when the block exits
+        without an error. Nested sessions reuse the outer one.
+
+        Yields:
+            The loaded MarketplaceConfig
+        """
+        if self._session is not None:
+            yield self._session
+            return
+
+        config = self._load_config()
+        self._session = config
+        self._session_index = self._build_index(config)
+        try:
+            yield config
+        finally:
+            self._session = None
+            self._session_index = {}
+        self._save_config(config)
+
     def add_plugin(self, plugin_path: Path, mcp_info: MCPInfo) -> None:
         """Add a plugin to the marketplace catalog.
 
@@ -55,38 +91,27 @@ class Marketplace:
             plugin_path: Path to the plugin directory
             mcp_info: MCP information for the plugin
         """
-        config = self._load_config()
+        with self._lock, self.session() as config:
+            self._upsert_plugin(config, plugin_path, mcp_info)
 
-        # Calculate relative path from marketplace root
-        try:
-            relative_path = plugin_path.relative_to(self.path)
-            source = f"./{relative_path}"
-        except ValueError:
-            source = str(plugin_path)
-
-        # Create plugin entry
-        plugin_name = plugin_path.name
-        plugin_entry = MarketplacePlugin(
-            name=plugin_name,
-            source=source,
-            description=mcp_info.description or f"MCP server: {mcp_info.name}",
-            category="mcp",
-            homepage=mcp_info.homepage,
-        )
+    async def aadd_plugin(self, plugin_path: Path, mcp_info: MCPInfo) -> None:
+        """Run `add_plugin` in a worker thread so disk I/O doesn't block the event loop.
 
-        # Check if plugin already exists, update if so
-        existing_idx = None
-        for idx, p in enumerate(config.plugins):
-            if p.name == plugin_name:
-                existing_idx = idx
-                break
+        Args:
+            plugin_path: Path to the plugin directory
+            mcp_info: MCP information for the plugin
+        """
+        await asyncio.to_thread(self.add_plugin, plugin_path, mcp_info)
 
-        if existing_idx is not None:
-            config.plugins[existing_idx] = plugin_entry
-        else:
-            config.plugins.append(plugin_entry)
+    def add_plugins(self, entries: list[tuple[Path, MCPInfo]]) -> None:
+        """Add several plugins to the marketplace catalog with a single write.
 
-        self._save_config(config)
+        Args:
+            entries: (plugin directory, MCP information) pairs
+        """
+        with self._lock, self.session() as config:
+            for plugin_path, mcp_info in entries:
+                self._upsert_plugin(config, plugin_path, mcp_info)
 
     def remove_plugin(self, name: str) -> bool:
         """Remove a plugin from the marketplace.
@@ -97,15 +122,16 @@ class Marketplace:
         Returns:
             True if plugin was removed, False if not found
         """
-        config = self._load_config()
-
-        original_count = len(config.plugins)
-        config.plugins = [p for p in config.plugins if p.name != name]
-
-        if len(config.plugins) < original_count:
-            self._save_config(config)
+        with self._lock, self.session() as config:
+            idx = self._session_index.pop(name, None)
+            if idx is None:
+                return False
+
+            del config.plugins[idx]
+            for other, other_idx in self._session_index.items():
+                if other_idx > idx:
+                    self._session_index[other] = other_idx - 1
             return True
-        return False
 
     def list_plugins(self) -> list[dict]:
         """List all plugins in the marketplace.
@@ -113,8 +139,11 @@ class Marketplace:
         Returns:
             List of plugin dictionaries
         """
-        config = self._load_config()
-        return [p.model_dump() for p in config.plugins]
+        if self._session is not None:
+            return [p.model_dump() for p in self._session.plugins]
+
+        # Read-only path: return the stored entries without validating them
+        return self._load_data().get("plugins", [])
 
     def get_plugin(self, name: str) -> dict | None:
         """Get plugin details by name.
@@ -125,26 +154,77 @@ class Marketplace:
         Returns:
             Plugin dictionary or None if not found
         """
+        if self._session is not None:
+            idx = self._session_index.get(name)
+            return self._session.plugins[idx].model_dump() if idx is not None else None
+
         config = self._load_config()
         for plugin in config.plugins:
             if plugin.name == name:
                 return plugin.model_dump()
         return None
 
-    def _load_config(self) -> MarketplaceConfig:
-        """Load marketplace configuration from file."""
+    def _upsert_plugin(
+        self, config: MarketplaceConfig, plugin_path: Path, mcp_info: MCPInfo
+    ) -> None:
+        """Add or replace a plugin entry in the session configuration."""
+        # Calculate relative path from marketplace root
+        try:
+            relative_path = plugin_path.relative_to(self.path)
+            source = f"./{relative_path}"
+        except ValueError:
+            source = str(plugin_path)
+
+        # Create plugin entry
+        plugin_name = plugin_path.name
+        plugin_entry = MarketplacePlugin(
+            name=plugin_name,
+            source=source,
+            description=mcp_info.description or f"MCP server: {mcp_info.name}",
+            category="mcp",
+            homepage=mcp_info.homepage,
+        )
+
+        # Check if plugin already exists, update if so
+        existing_idx = self._session_index.get(plugin_name)
+        if existing_idx is not None:
+            config.plugins[existing_idx] = plugin_entry
+        else:
+            self._session_index[plugin_name] = len(config.plugins)
+            config.plugins.append(plugin_entry)
+
+    @staticmethod
+    def _build_index(config: MarketplaceConfig) -> dict[str, int]:
+        """Map plugin names to their position (first occurrence wins)."""
+        index: dict[str, int] = {}
+        for idx, plugin in enumerate(config.plugins):
+            index.setdefault(plugin.name, idx)
+        return index
+
+    def _load_data(self) -> dict:
+        """Load the raw marketplace JSON from file."""
         if not self.config_path.exists():
             self.initialize()
 
-        with open(self.config_path, encoding="utf-8") as f:
-            data = json.load(f)
+        return orjson.loads(self.config_path.read_bytes())
 
-        return MarketplaceConfig(**data)
+    def _load_config(self) -> MarketplaceConfig:
+        """Load and validate marketplace configuration from file."""
+        return MarketplaceConfig(**self._load_data())
 
     def _save_config(self, config: MarketplaceConfig) -> None:
-        """Save marketplace configuration to file."""
+        """Save marketplace configuration to file.
+
+        The file is written to a temporary sibling and moved into place, so
+        an interrupted write never leaves a truncated marketplace.json. Nothing
+        is written if the content is unchanged.
+        """
+        payload = config.model_dump_json(indent=2, exclude_none=True).encode() + b"\n"
+        if self.config_path.exists() and self.config_path.read_bytes() == payload:
+            return
+
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(config.model_dump(), f, indent=2, ensure_ascii=False)
-            f.write("\n")
+        tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, self.config_path)
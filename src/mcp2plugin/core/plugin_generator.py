@@ -1,10 +1,23 @@
 """Plugin configuration generator."""
 
-import json
+import asyncio
+import re
+from functools import lru_cache
 from pathlib import Path
 
 from ..models import MCPInfo, MCPServerConfig, PluginConfig, PluginAuthor
 
+# Patterns used by PluginGenerator._sanitize_name
+_RE_NONWORD = re.compile(r"[^\w\s-]")
+_RE_WS = re.compile(r"[\s_]+")
+_RE_DUP_HYPHEN = re.compile(r"-+")
+
+
+@lru_cache(maxsize=1024)
+def _env_template(var: str) -> str:
+    """Get the `${VAR}` placeholder used for an environment variable."""
+    return f"${{{var}}}"
+
 
 class PluginGenerator:
     """Generates Claude Code plugin configuration files."""
@@ -38,10 +51,21 @@ class PluginGenerator:
         # Generate plugin.json
         plugin_config = self._create_plugin_config(mcp_info, plugin_name)
         plugin_json_path = claude_plugin_dir / "plugin.json"
-        self._write_json(plugin_json_path, plugin_config.model_dump())
+        self._write_json(plugin_json_path, plugin_config)
 
         return plugin_dir
 
+    async def agenerate(self, mcp_info: MCPInfo) -> Path:
+        """Run `generate` in a worker thread so disk I/O doesn't block the event loop.
+
+        Args:
+            mcp_info: MCP server information
+
+        Returns:
+            Path to the generated plugin directory
+        """
+        return await asyncio.to_thread(self.generate, mcp_info)
+
     def _create_plugin_config(self, mcp_info: MCPInfo, plugin_name: str) -> PluginConfig:
         """Create plugin configuration from MCP info.
 
@@ -69,7 +93,7 @@ class PluginGenerator:
 
             # Add environment variables if needed
             if mcp_info.env_vars:
-                server_config.env = {var: f"${{{var}}}" for var in mcp_info.env_vars}
+                server_config.env = {var: _env_template(var) for var in mcp_info.env_vars}
 
         # Create author info
         author = None
@@ -95,26 +119,39 @@ class PluginGenerator:
         Returns:
             Sanitized kebab-case name
         """
-        import re
-
-        # Remove special characters and convert to lowercase
-        sanitized = re.sub(r"[^\w\s-]", "", name.lower())
+        lowered = name.lower()
+
+        # Fast path: most names already arrive in kebab-case
+        if (
+            lowered.replace("-", "").isalnum()
+            and "--" not in lowered
+            and not lowered.startswith("-")
+            and not lowered.endswith("-")
+        ):
+            return lowered
+
+        # Remove special characters
+        sanitized = _RE_NONWORD.sub("", lowered)
         # Replace spaces and underscores with hyphens
-        sanitized = re.sub(r"[\s_]+", "-", sanitized)
+        sanitized = _RE_WS.sub("-", sanitized)
         # Remove consecutive hyphens
-        sanitized = re.sub(r"-+", "-", sanitized)
+        sanitized = _RE_DUP_HYPHEN.sub("-", sanitized)
         # Remove leading/trailing hyphens
         sanitized = sanitized.strip("-")
 
         return sanitized or "unknown-plugin"
 
-    def _write_json(self, path: Path, data: dict) -> None:
-        """Write JSON data to file with pretty formatting.
+    def _write_json(self, path: Path, plugin_config: PluginConfig) -> None:
+        """Write plugin configuration to file with pretty formatting.
+
+        The file is left untouched if it already has the same content, so
+        re-converting an unchanged MCP doesn't trigger file watchers.
 
         Args:
             path: Output file path
-            data: JSON data to write
+            plugin_config: Plugin configuration to write
         """
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+        payload = plugin_config.model_dump_json(indent=2, exclude_none=True).encode() + b"\n"
+        if path.exists() and path.read_bytes() == payload:
+            return
+        path.write_bytes(payload)
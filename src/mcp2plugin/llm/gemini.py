@@ -1,23 +1,203 @@
 """Gemini API integration for intelligent MCP parsing."""
 
-import json
+import asyncio
+import io
 import os
 import re
 
+import orjson
 from google import genai
 from google.genai import types
+from selectolax.lexbor import LexborHTMLParser
 
 from ..models import MCPInfo, MCPTool
 
+_WS_RUN = re.compile(r"\s+")
+
+# Elements that carry no readable page content
+_NON_CONTENT_TAGS = ["script", "style", "noscript", "svg", "template", "nav", "footer"]
+
+# Below this many pages, batch jobs aren't worth their queueing latency
+BATCH_MIN_PAGES = 4
+
+# Response schemas for JSON mode, matching the shapes described in the prompts
+_TOOL_SCHEMA = types.Schema(
+    type=types.Type.OBJECT,
+    properties={
+        "name": types.Schema(type=types.Type.STRING),
+        "description": types.Schema(type=types.Type.STRING),
+    },
+    required=["name"],
+)
+_STRING_LIST_SCHEMA = types.Schema(type=types.Type.ARRAY, items=types.Schema(type=types.Type.STRING))
+
+_PARSE_SCHEMA = types.Schema(
+    type=types.Type.OBJECT,
+    properties={
+        "name": types.Schema(type=types.Type.STRING),
+        "description": types.Schema(type=types.Type.STRING),
+        "author": types.Schema(type=types.Type.STRING),
+        "tools": types.Schema(type=types.Type.ARRAY, items=_TOOL_SCHEMA),
+        "install_command": types.Schema(type=types.Type.STRING),
+        "install_args": _STRING_LIST_SCHEMA,
+        "connection_type": types.Schema(type=types.Type.STRING, enum=["stdio", "http"]),
+        "http_url": types.Schema(type=types.Type.STRING, nullable=True),
+        "env_vars": _STRING_LIST_SCHEMA,
+        "homepage": types.Schema(type=types.Type.STRING, nullable=True),
+    },
+    required=["name", "description", "tools", "install_command", "install_args", "connection_type"],
+)
+
+_ENHANCE_SCHEMA = types.Schema(
+    type=types.Type.OBJECT,
+    properties={
+        "description": types.Schema(type=types.Type.STRING),
+        "tools": types.Schema(type=types.Type.ARRAY, items=_TOOL_SCHEMA),
+        "install_command": types.Schema(type=types.Type.STRING),
+        "install_args": _STRING_LIST_SCHEMA,
+    },
+)
+
+_CONNECTION_SCHEMA = types.Schema(
+    type=types.Type.OBJECT,
+    properties={
+        "type": types.Schema(type=types.Type.STRING, enum=["stdio", "http"]),
+        "command": types.Schema(type=types.Type.STRING),
+        "args": _STRING_LIST_SCHEMA,
+        "url": types.Schema(type=types.Type.STRING),
+    },
+    required=["type"],
+)
+
+# Plain dict so it can also be embedded in batch request JSONL
+_PARSE_GENERATION_CONFIG = {
+    "temperature": 0.1,
+    "max_output_tokens": 2000,
+    "response_mime_type": "application/json",
+    "response_schema": _PARSE_SCHEMA.model_dump(mode="json", exclude_none=True),
+}
+
+# Static instructions go in the system instruction so every request shares
+# an identical prefix (eligible for Gemini's implicit context caching) and
+# only the page-specific details are sent as contents.
+_PARSE_INSTRUCTIONS = """Analyze the given MCP (Model Context Protocol) server page and extract structured information.
+
+Extract the following information in JSON format:
+{
+    "name": "MCP server name",
+    "description": "Brief description of what the MCP does",
+    "author": "Author name or username",
+    "tools": [
+        {"name": "tool_name", "description": "what the tool does"}
+    ],
+    "install_command": "npx, uvx, or other command",
+    "install_args": ["list", "of", "arguments"],
+    "connection_type": "stdio or http",
+    "http_url": "URL if connection_type is http, null otherwise",
+    "env_vars": ["LIST_OF_REQUIRED", "ENVIRONMENT_VARIABLES"],
+    "homepage": "GitHub or project homepage URL"
+}
+
+Important:
+- For install_command, identify the package manager (npx, uvx, bunx, npm exec)
+- For install_args, include all necessary arguments (e.g., ["-y", "package-name"])
+- Only include actual tools/functions the MCP provides, not generic features
+- connection_type should be "stdio" for local servers, "http" for remote/hosted
+- Only include env_vars that are actually required for the MCP to function
+
+Return ONLY valid JSON."""
+
+_ENHANCE_INSTRUCTIONS = """Given the MCP server information, help fill in missing details.
+
+Provide missing information in JSON format:
+{
+    "description": "description if missing",
+    "tools": [{"name": "tool_name", "description": "description"}],
+    "install_command": "command if missing",
+    "install_args": ["args", "if", "missing"]
+}
+
+Only include fields that need to be filled in. Return valid JSON only."""
+
+_DESCRIPTION_INSTRUCTIONS = """Create a concise, professional description for a Claude Code plugin from the given MCP server details.
+
+Write a 1-2 sentence description that:
+1. Explains what the plugin does
+2. Highlights key capabilities
+3. Is written for developers
+
+Return ONLY the description text, no quotes or formatting."""
+
+_CONNECTION_INSTRUCTIONS = """Analyze the given MCP server page to determine the connection type.
+
+Determine:
+1. Is this a LOCAL server (runs on user's machine via stdio) or REMOTE server (hosted, accessed via HTTP)?
+2. What is the installation/connection configuration?
+
+For LOCAL/stdio servers, respond with:
+{"type": "stdio", "command": "npx", "args": ["-y", "package-name"]}
+
+For REMOTE/http servers, respond with:
+{"type": "http", "url": "https://server-url/path"}
+
+Return ONLY valid JSON."""
+
+_BATCH_DONE_STATES = {
+    types.JobState.JOB_STATE_SUCCEEDED,
+    types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+    types.JobState.JOB_STATE_FAILED,
+    types.JobState.JOB_STATE_CANCELLED,
+    types.JobState.JOB_STATE_EXPIRED,
+}
+
+
+def _visible_text(html: str) -> str:
+    """Reduce an HTML page to its visible text with whitespace collapsed.
+
+    Markup, scripts and navigation make up most of a raw page but carry no
+    signal for the model, so prompts are built from this instead.
+    """
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(_NON_CONTENT_TAGS)
+    root = tree.body or tree.root
+    if root is None:
+        return ""
+    return _WS_RUN.sub(" ", root.text(separator=" ", strip=True)).strip()
+
+
+def _strip_fence(text: str) -> str:
+    """Remove a markdown code fence around a response, if present.
+
+    JSON mode should never produce one; this just keeps decoding robust if
+    the model wraps its output anyway.
+    """
+    if not text.startswith("```"):
+        return text
+    text = text[3:]
+    if text[:4].lower() == "json":
+        text = text[4:]
+    text = text.lstrip("\n")
+    if text.endswith("```"):
+        text = text[:-3].rstrip("\n")
+    return text
+
+
+def _tier_config(service_tier: str | None) -> dict:
+    """Config fields selecting a service tier; empty for the API default."""
+    return {"service_tier": service_tier} if service_tier else {}
+
 
 class GeminiParser:
     """Uses Gemini API to intelligently parse and enhance MCP data."""
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, service_tier: str | None = None):
         """Initialize the Gemini parser.
 
         Args:
             api_key: Gemini API key. If not provided, uses GEMINI_API_KEY env var.
+            service_tier: Gemini service tier for requests ("flex", "standard"
+                or "priority"). Defaults to the API's standard tier; bulk
+                callers can opt into the discounted, slower flex tier.
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
@@ -28,74 +208,132 @@ class GeminiParser:
 
         self.client = genai.Client(api_key=self.api_key)
         self.model = "gemini-2.0-flash"
+        self.service_tier = service_tier
 
-    async def parse_mcp_page(self, html_content: str, url: str) -> dict:
+    async def parse_mcp_page(
+        self, html_content: str, url: str, service_tier: str | None = None
+    ) -> dict:
         """Extract structured MCP data from HTML content using Gemini.
 
         Args:
             html_content: Raw HTML content of the MCP page
             url: Source URL for context
+            service_tier: Service tier for this call, overriding the parser's
+                default
 
         Returns:
             Dictionary with extracted MCP information
         """
-        prompt = f"""Analyze this MCP (Model Context Protocol) server page and extract structured information.
+        response = await self.client.aio.models.generate_content(
+            model=self.model,
+            contents=self._build_parse_prompt(html_content, url),
+            config=types.GenerateContentConfig(
+                system_instruction=_PARSE_INSTRUCTIONS,
+                **_tier_config(service_tier or self.service_tier),
+                **_PARSE_GENERATION_CONFIG,
+            ),
+        )
 
-URL: {url}
+        return self._parse_json_response(response.text)
 
-HTML Content (truncated):
-{html_content[:15000]}
+    async def parse_mcp_pages_batch(
+        self,
+        pages: list[tuple[str, str]],
+        poll_interval: float = 10.0,
+    ) -> list[dict | Exception]:
+        """Extract structured MCP data from many pages via the Gemini Batch API.
 
-Extract the following information in JSON format:
-{{
-    "name": "MCP server name",
-    "description": "Brief description of what the MCP does",
-    "author": "Author name or username",
-    "tools": [
-        {{"name": "tool_name", "description": "what the tool does"}}
-    ],
-    "install_command": "npx, uvx, or other command",
-    "install_args": ["list", "of", "arguments"],
-    "connection_type": "stdio or http",
-    "http_url": "URL if connection_type is http, null otherwise",
-    "env_vars": ["LIST_OF_REQUIRED", "ENVIRONMENT_VARIABLES"],
-    "homepage": "GitHub or project homepage URL"
-}}
+        Batch jobs are billed at a discount and are not rate limited like
+        interactive calls, but may take minutes to complete. Fewer than
+        `BATCH_MIN_PAGES` pages are parsed with concurrent regular calls.
 
-Important:
-- For install_command, identify the package manager (npx, uvx, bunx, npm exec)
-- For install_args, include all necessary arguments (e.g., ["-y", "package-name"])
-- Only include actual tools/functions the MCP provides, not generic features
-- connection_type should be "stdio" for local servers, "http" for remote/hosted
-- Only include env_vars that are actually required for the MCP to function
+        Args:
+            pages: (url, html_content) pairs
+            poll_interval: Seconds between batch job status checks
 
-Return ONLY valid JSON, no markdown formatting."""
+        Returns:
+            One entry per page, in input order: the extracted dictionary, or
+            the exception raised while parsing that page
+        """
+        if len(pages) < BATCH_MIN_PAGES:
+            return await asyncio.gather(
+                # Still a bulk job, so use the discounted tier
+                *(self.parse_mcp_page(html, url, service_tier="flex") for url, html in pages),
+                return_exceptions=True,
+            )
 
-        response = await self.client.aio.models.generate_content(
+        # One JSONL line per page, keyed by its position
+        requests = io.BytesIO()
+        for idx, (url, html) in enumerate(pages):
+            line = {
+                "key": str(idx),
+                "request": {
+                    "contents": [
+                        {"role": "user", "parts": [{"text": self._build_parse_prompt(html, url)}]}
+                    ],
+                    "system_instruction": {"parts": [{"text": _PARSE_INSTRUCTIONS}]},
+                    "generation_config": _PARSE_GENERATION_CONFIG,
+                },
+            }
+            requests.write(orjson.dumps(line) + b"\n")
+        requests.seek(0)
+
+        uploaded = await self.client.aio.files.upload(
+            file=requests,
+            config=types.UploadFileConfig(display_name="mcp2plugin-parse", mime_type="jsonl"),
+        )
+        job = await self.client.aio.batches.create(
             model=self.model,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                temperature=0.1,
-                max_output_tokens=2000,
-            ),
+            src=uploaded.name,
+            config=types.CreateBatchJobConfig(display_name="mcp2plugin-parse"),
         )
 
-        # Parse the JSON response
-        response_text = response.text.strip()
-
-        # Remove markdown code blocks if present
-        if response_text.startswith("```"):
-            response_text = re.sub(r"```json?\n?", "", response_text)
-            response_text = re.sub(r"\n?```$", "", response_text)
-
+        while job.state not in _BATCH_DONE_STATES:
+            await asyncio.sleep(poll_interval)
+            job = await self.client.aio.batches.get(name=job.name)
+
+        if job.state not in (
+            types.JobState.JOB_STATE_SUCCEEDED,
+            types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+        ):
+            raise RuntimeError(f"Gemini batch job {job.name} ended in state {job.state}")
+
+        content = await self.client.aio.files.download(file=job.dest.file_name)
+
+        results: list[dict | Exception] = [
+            ValueError("Missing result in Gemini batch output") for _ in pages
+        ]
+        for raw_line in content.splitlines():
+            if not raw_line.strip():
+                continue
+            record = orjson.loads(raw_line)
+            idx = int(record["key"])
+            try:
+                if "error" in record:
+                    raise ValueError(f"Gemini batch request failed: {record['error']}")
+                parts = record["response"]["candidates"][0]["content"]["parts"]
+                text = "".join(part.get("text", "") for part in parts)
+                results[idx] = self._parse_json_response(text)
+            except Exception as e:
+                results[idx] = e
+
+        return results
+
+    def _build_parse_prompt(self, html_content: str, url: str) -> str:
+        """Build the per-page prompt used with `_PARSE_INSTRUCTIONS`."""
+        return f"""URL: {url}
+
+Page text (truncated):
+{_visible_text(html_content)[:15000]}"""
+
+    def _parse_json_response(self, response_text: str) -> dict:
+        """Parse the JSON object returned by a JSON-mode Gemini request."""
         try:
-            return json.loads(response_text)
-        except json.JSONDecodeError:
-            # Try to extract JSON from the response
-            json_match = re.search(r"\{[\s\S]*\}", response_text)
-            if json_match:
-                return json.loads(json_match.group(0))
-            raise ValueError(f"Failed to parse Gemini response as JSON: {response_text[:200]}")
+            return orjson.loads(_strip_fence(response_text.strip()))
+        except orjson.JSONDecodeError as e:
+            raise ValueError(
+                f"Failed to parse Gemini response as JSON: {response_text[:200]}"
+            ) from e
 
     async def enhance_mcp_info(self, mcp_info: MCPInfo, html_content: str) -> MCPInfo:
         """Enhance existing MCP info with additional details from Gemini.
@@ -117,9 +355,7 @@ Return ONLY valid JSON, no markdown formatting."""
         if not needs_enhancement:
             return mcp_info
 
-        prompt = f"""Given this MCP server information, help fill in missing details.
-
-Current information:
+        prompt = f"""Current information:
 - Name: {mcp_info.name}
 - Description: {mcp_info.description or 'MISSING'}
 - Tools: {[t.name for t in mcp_info.tools] if mcp_info.tools else 'MISSING'}
@@ -127,42 +363,32 @@ Current information:
 - Install args: {mcp_info.install_args or 'MISSING'}
 
 Page content (for context):
-{html_content[:10000]}
-
-Provide missing information in JSON format:
-{{
-    "description": "description if missing",
-    "tools": [{{"name": "tool_name", "description": "description"}}],
-    "install_command": "command if missing",
-    "install_args": ["args", "if", "missing"]
-}}
-
-Only include fields that need to be filled in. Return valid JSON only."""
+{_visible_text(html_content)[:10000]}"""
 
         try:
             response = await self.client.aio.models.generate_content(
                 model=self.model,
                 contents=prompt,
                 config=types.GenerateContentConfig(
+                    system_instruction=_ENHANCE_INSTRUCTIONS,
+                    **_tier_config(self.service_tier),
                     temperature=0.1,
                     max_output_tokens=1500,
+                    response_mime_type="application/json",
+                    response_schema=_ENHANCE_SCHEMA,
                 ),
             )
 
-            response_text = response.text.strip()
-            if response_text.startswith("```"):
-                response_text = re.sub(r"```json?\n?", "", response_text)
-                response_text = re.sub(r"\n?```$", "", response_text)
-
-            enhancements = json.loads(response_text)
+            enhancements = orjson.loads(_strip_fence(response.text.strip()))
 
             # Apply enhancements
             if not mcp_info.description and enhancements.get("description"):
                 mcp_info.description = enhancements["description"]
 
             if not mcp_info.tools and enhancements.get("tools"):
+                # Shape is guaranteed by _ENHANCE_SCHEMA
                 mcp_info.tools = [
-                    MCPTool(name=t["name"], description=t.get("description", ""))
+                    MCPTool.trusted(name=t["name"], description=t.get("description", ""))
                     for t in enhancements["tools"]
                 ]
 
@@ -183,6 +409,7 @@ Only include fields that need to be filled in. Return valid JSON only."""
         mcp_name: str,
         tools: list[MCPTool],
         raw_description: str,
+        service_tier: str | None = None,
     ) -> str:
         """Generate a polished Claude Code plugin description.
 
@@ -190,6 +417,8 @@ Only include fields that need to be filled in. Return valid JSON only."""
             mcp_name: Name of the MCP server
             tools: List of tools provided by the MCP
             raw_description: Original description text
+            service_tier: Service tier for this call, overriding the parser's
+                default (e.g. "priority" when a user is waiting on it)
 
         Returns:
             Polished description string
@@ -198,24 +427,17 @@ Only include fields that need to be filled in. Return valid JSON only."""
             f"- {t.name}: {t.description}" for t in tools[:10]
         ) if tools else "No tools listed"
 
-        prompt = f"""Create a concise, professional description for a Claude Code plugin.
-
-MCP Name: {mcp_name}
+        prompt = f"""MCP Name: {mcp_name}
 Original Description: {raw_description or 'None provided'}
 Available Tools:
-{tool_list}
-
-Write a 1-2 sentence description that:
-1. Explains what the plugin does
-2. Highlights key capabilities
-3. Is written for developers
-
-Return ONLY the description text, no quotes or formatting."""
+{tool_list}"""
 
         response = await self.client.aio.models.generate_content(
             model=self.model,
             contents=prompt,
             config=types.GenerateContentConfig(
+                system_instruction=_DESCRIPTION_INSTRUCTIONS,
+                **_tier_config(service_tier or self.service_tier),
                 temperature=0.3,
                 max_output_tokens=200,
             ),
@@ -237,43 +459,28 @@ Return ONLY the description text, no quotes or formatting."""
         Returns:
             Tuple of (connection_type, config_dict)
         """
-        prompt = f"""Analyze this MCP server page to determine the connection type.
-
-Page content (excerpt):
-{page_content[:8000]}
+        prompt = f"""Page content (excerpt):
+{_visible_text(page_content)[:8000]}
 
-Installation hints: {install_hints}
-
-Determine:
-1. Is this a LOCAL server (runs on user's machine via stdio) or REMOTE server (hosted, accessed via HTTP)?
-2. What is the installation/connection configuration?
-
-For LOCAL/stdio servers, respond with:
-{{"type": "stdio", "command": "npx", "args": ["-y", "package-name"]}}
-
-For REMOTE/http servers, respond with:
-{{"type": "http", "url": "https://server-url/path"}}
-
-Return ONLY valid JSON."""
+Installation hints: {install_hints}"""
 
         response = await self.client.aio.models.generate_content(
             model=self.model,
             contents=prompt,
             config=types.GenerateContentConfig(
+                system_instruction=_CONNECTION_INSTRUCTIONS,
+                **_tier_config(self.service_tier),
                 temperature=0.1,
                 max_output_tokens=300,
+                response_mime_type="application/json",
+                response_schema=_CONNECTION_SCHEMA,
             ),
         )
 
-        response_text = response.text.strip()
-        if response_text.startswith("```"):
-            response_text = re.sub(r"```json?\n?", "", response_text)
-            response_text = re.sub(r"\n?```$", "", response_text)
-
         try:
-            config = json.loads(response_text)
+            config = orjson.loads(_strip_fence(response.text.strip()))
             conn_type = config.pop("type", "stdio")
             return conn_type, config
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # Default to stdio
             return "stdio", {"command": "npx", "args": ["-y", "unknown-mcp"]}
@@ -10,6 +10,15 @@ class MCPTool(BaseModel):
     name: str
     description: str = ""
 
+    @classmethod
+    def trusted(cls, name: str, description: str = "") -> "MCPTool":
+        """Build a tool from already-validated data, skipping validation.
+
+        Only use this for data whose shape is guaranteed upstream, such as
+        Gemini responses constrained by a response schema.
+        """
+        return cls.model_construct(name=name, description=description)
+
 
 class MCPInfo(BaseModel):
     """Represents MCP server information extracted from sources."""
@@ -29,3 +38,10 @@ class MCPInfo(BaseModel):
     def get_server_name(self) -> str:
         """Get a sanitized server name for use in configuration."""
         return self.name.lower().replace(" ", "-").replace("_", "-")
+
+    def is_complete(self) -> bool:
+        """Check whether the info is rich enough to skip LLM enhancement."""
+        has_connection = (
+            bool(self.http_url) if self.connection_type == "http" else bool(self.install_command)
+        )
+        return len(self.description) >= 40 and bool(self.tools) and has_connection
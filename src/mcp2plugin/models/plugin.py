@@ -41,15 +41,9 @@ class PluginConfig(BaseModel):
     )
 
     def model_dump(self, **kwargs):
-        """Override to exclude None values and serialize nested models."""
+        """Override to exclude None values (applies to nested models too)."""
         kwargs.setdefault("exclude_none", True)
-        data = super().model_dump(**kwargs)
-        if "mcpServers" in data:
-            data["mcpServers"] = {
-                k: {kk: vv for kk, vv in v.items() if vv is not None}
-                for k, v in data["mcpServers"].items()
-            }
-        return data
+        return super().model_dump(**kwargs)
 
 
 class MarketplacePlugin(BaseModel):
@@ -2,12 +2,28 @@
 
 from abc import ABC, abstractmethod
 
+import httpx
+
 from ..models import MCPInfo
 
 
 class MCPSource(ABC):
     """Abstract base class for MCP source parsers."""
 
+    # Settings for the HTTP client a source creates for itself
+    client_timeout: httpx.Timeout | float = 30.0
+    client_limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+    def __init__(self, client: httpx.AsyncClient | None = None):
+        """Initialize the source.
+
+        Args:
+            client: HTTP client to fetch pages with. If not provided, one is
+                created on first use and closed by `aclose`.
+        """
+        self._client = client
+        self._owns_client = client is None
+
     @abstractmethod
     def can_handle(self, url: str) -> bool:
         """Check if this source can handle the given URL.
@@ -20,6 +36,41 @@ class MCPSource(ABC):
         """
         pass
 
+    async def can_handle_async(self, url: str) -> bool:
+        """Asynchronously check if this source can handle the given URL.
+
+        Sources whose check needs network access (e.g. a HEAD probe) should
+        override this; the default delegates to `can_handle`.
+
+        Args:
+            url: The URL to check
+
+        Returns:
+            True if this source can handle the URL
+        """
+        return self.can_handle(url)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this source created it."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client, creating it on first use.
+
+        One client is reused for every fetch so connections stay alive, and
+        HTTP/2 multiplexes concurrent page fetches over them.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                follow_redirects=True,
+                timeout=self.client_timeout,
+                limits=self.client_limits,
+            )
+        return self._client
+
     @abstractmethod
     async def fetch(self, url: str) -> MCPInfo:
         """Fetch and parse MCP information from the URL.
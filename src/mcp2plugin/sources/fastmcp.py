@@ -1,21 +1,80 @@
 """FastMCP.me source parser."""
 
+import asyncio
 import re
+from functools import lru_cache
 
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 from ..models import MCPInfo, MCPTool
-from ..utils.url_parser import FASTMCP_PATTERN
+from ..utils.html import text_nodes
+from ..utils.url_parser import FASTMCP_MARKER, FASTMCP_PATTERN
 from .base import MCPSource
 
+_DESC_SELECTOR = "p[class*=description i], p[class*=summary i]"
+_AUTHOR_RE = re.compile(r"@\w+")
+_AUTHOR_NAME_RE = re.compile(r"@(\w+)")
+_URL_EXTRACT = re.compile(r"(https?://[^\s\"'<>]+)")
+_TOOL_SECTION_SELECTOR = ", ".join(
+    f"{tag}[class*={keyword} i]"
+    for tag in ("div", "section", "ul")
+    for keyword in ("tool", "feature", "capability")
+)
+# Elements inside a tool section that may each describe one tool
+_TOOL_ITEM_TAGS = frozenset({"li", "div", "p"})
+_TOOL_SPLIT = re.compile(r"[-–:]")
+
+_MAX_TOOLS = 20
+
+# Pages are only read up to this size; everything we extract is near the top
+_MAX_PAGE_BYTES = 200_000
+
+# Common patterns for MCP installation
+_INSTALL_PATTERNS = [
+    (re.compile(r"npx\s+-y\s+([^\s<\"']+)"), "npx"),
+    (re.compile(r"uvx\s+([^\s<\"']+)"), "uvx"),
+    (re.compile(r"bunx\s+([^\s<\"']+)"), "bunx"),
+    (re.compile(r"npm\s+exec\s+([^\s<\"']+)"), "npm"),
+]
+
+# Common patterns for environment variables, scanned in a single pass
+_ENV_UNION = re.compile(
+    r"\$\{(?P<b>[A-Z][A-Z0-9_]+)\}"  # ${VAR_NAME}
+    r"|\$(?P<d>[A-Z][A-Z0-9_]+)"  # $VAR_NAME
+    r"|(?P<e>[A-Z][A-Z0-9_]+)="  # VAR_NAME=
+    r"|env[:\s]+(?P<f>[A-Z][A-Z0-9_]+)"  # env: VAR_NAME
+)
+_ENV_GROUPS = ("b", "d", "e", "f")
+
+# Common non-env strings that look like variable names
+_ENV_FORBIDDEN = frozenset({"url", "uri", "http", "json", "xml"})
+
+
+@lru_cache(maxsize=256)
+def _parse_url(url: str) -> re.Match | None:
+    """Match a URL against FASTMCP_PATTERN, memoized for can_handle/fetch."""
+    return FASTMCP_PATTERN.match(url)
+
 
 class FastMCPSource(MCPSource):
     """Parser for fastmcp.me MCP server pages."""
 
+    def __init__(self, client: httpx.AsyncClient | None = None, concurrency: int = 8):
+        """Initialize the source.
+
+        Args:
+            client: HTTP client to fetch pages with. If not provided, one is
+                created on first use and closed by `aclose`.
+            concurrency: Maximum number of pages `fetch_many` fetches at once
+        """
+        super().__init__(client)
+        self.concurrency = concurrency
+
     def can_handle(self, url: str) -> bool:
         """Check if this source can handle the given URL."""
-        return bool(FASTMCP_PATTERN.match(url))
+        # Cheap substring test first; most URLs from other hosts stop here
+        return FASTMCP_MARKER in url and _parse_url(url) is not None
 
     async def fetch(self, url: str) -> MCPInfo:
         """Fetch and parse MCP information from fastmcp.me.
@@ -26,71 +85,76 @@ class FastMCPSource(MCPSource):
         Returns:
             MCPInfo containing the parsed data
         """
-        async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-
-        html = response.text
-        soup = BeautifulSoup(html, "html.parser")
-
         # Extract MCP name from URL
-        match = FASTMCP_PATTERN.match(url)
+        match = _parse_url(url)
         if not match:
             raise ValueError(f"Invalid fastmcp.me URL: {url}")
 
         mcp_name = match.group(2)
 
+        async with self._get_client().stream("GET", url) as response:
+            response.raise_for_status()
+            buf = bytearray()
+            async for chunk in response.aiter_bytes():
+                buf.extend(chunk)
+                if len(buf) >= _MAX_PAGE_BYTES:
+                    break
+
+        html = buf.decode(response.encoding or "utf-8", errors="replace")
+        tree = LexborHTMLParser(html)
+        # Script/style contents are not page text
+        tree.strip_tags(["script", "style", "template"])
+        page_text = tree.text()
+
         # Extract title/name from page
-        title_elem = soup.find("h1")
-        display_name = title_elem.get_text(strip=True) if title_elem else mcp_name
+        title_elem = tree.css_first("h1")
+        display_name = title_elem.text(strip=True) if title_elem else mcp_name
 
         # Extract description from meta tag or content
         description = ""
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc and meta_desc.get("content"):
-            description = meta_desc["content"]
+        meta_desc = tree.css_first('meta[name="description"]')
+        if meta_desc and meta_desc.attributes.get("content"):
+            description = meta_desc.attributes["content"]
         else:
             # Try to find description in page content
-            desc_elem = soup.find("p", class_=re.compile(r"description|summary", re.I))
+            desc_elem = tree.css_first(_DESC_SELECTOR)
             if desc_elem:
-                description = desc_elem.get_text(strip=True)
+                description = desc_elem.text(strip=True)
 
         # Extract author
         author = ""
-        author_elem = soup.find(string=re.compile(r"@\w+"))
-        if author_elem:
-            author_match = re.search(r"@(\w+)", str(author_elem))
+        author_text = next((t for t in text_nodes(tree) if _AUTHOR_RE.search(t)), None)
+        if author_text:
+            author_match = _AUTHOR_NAME_RE.search(author_text)
             if author_match:
                 author = author_match.group(1)
 
         # Extract tools from the page
-        tools = self._extract_tools(soup)
+        tools = self._extract_tools(tree)
 
         # Extract installation command
-        install_command, install_args = self._extract_install_command(soup, mcp_name)
+        install_command, install_args = self._extract_install_command(page_text, mcp_name)
 
         # Determine connection type
         connection_type = "stdio"
         http_url = None
 
-        # Check for HTTP URL indicators
-        http_patterns = soup.find_all(string=re.compile(r"https?://.*mcp|endpoint|api", re.I))
-        if http_patterns:
-            for pattern in http_patterns:
-                http_match = re.search(r"(https?://[^\s\"'<>]+)", str(pattern))
-                if http_match and "mcp" in http_match.group(1).lower():
-                    connection_type = "http"
-                    http_url = http_match.group(1)
-                    break
+        # Check for an MCP endpoint URL in the page
+        for http_match in _URL_EXTRACT.finditer(page_text):
+            candidate = http_match.group(1)
+            if "mcp" in candidate.lower():
+                connection_type = "http"
+                http_url = candidate
+                break
 
         # Extract environment variables
-        env_vars = self._extract_env_vars(soup)
+        env_vars = self._extract_env_vars(page_text)
 
         # Extract homepage
         homepage = None
-        github_link = soup.find("a", href=re.compile(r"github\.com"))
+        github_link = tree.css_first('a[href*="github.com"]')
         if github_link:
-            homepage = github_link.get("href")
+            homepage = github_link.attributes.get("href")
 
         return MCPInfo(
             name=display_name or mcp_name,
@@ -106,56 +170,90 @@ class FastMCPSource(MCPSource):
             source_url=url,
         )
 
-    def _extract_tools(self, soup: BeautifulSoup) -> list[MCPTool]:
+    async def fetch_many(self, urls: list[str]) -> list[MCPInfo | BaseException]:
+        """Fetch and parse several fastmcp.me pages concurrently.
+
+        At most `concurrency` fetches run at a time.
+
+        Args:
+            urls: The fastmcp.me URLs
+
+        Returns:
+            One entry per URL, in input order: the parsed MCPInfo, or the
+            exception raised while fetching that URL
+        """
+        sem = asyncio.Semaphore(self.concurrency)
+
+        async def _one(url: str) -> MCPInfo:
+            async with sem:
+                return await self.fetch(url)
+
+        return await asyncio.gather(*(_one(url) for url in urls), return_exceptions=True)
+
+    def _extract_tools(self, tree: LexborHTMLParser) -> list[MCPTool]:
         """Extract tool information from the page."""
-        tools = []
+        # Keyed by tool name so repeated entries are only kept once
+        tools: dict[str, MCPTool] = {}
+        seen_texts: set[str] = set()
 
         # Look for tool sections or lists
-        tool_sections = soup.find_all(
-            ["div", "section", "ul"],
-            class_=re.compile(r"tool|feature|capability", re.I),
-        )
+        tool_sections = tree.css(_TOOL_SECTION_SELECTOR)
 
         for section in tool_sections:
-            items = section.find_all(["li", "div", "p"])
-            for item in items:
-                text = item.get_text(strip=True)
-                if text and len(text) > 5:
-                    # Try to split name and description
-                    parts = re.split(r"[-–:]", text, maxsplit=1)
-                    if len(parts) == 2:
-                        tools.append(MCPTool(name=parts[0].strip(), description=parts[1].strip()))
-                    else:
-                        tools.append(MCPTool(name=text[:50], description=text))
+            if len(tools) >= _MAX_TOOLS:
+                break
+            # traverse() is lazy, so the cap stops the walk early. It yields
+            # the section itself first; compare by mem_id, since == serializes
+            # both subtrees to HTML
+            section_id = section.mem_id
+            for item in section.traverse():
+                if len(tools) >= _MAX_TOOLS:
+                    break
+                if item.tag not in _TOOL_ITEM_TAGS or item.mem_id == section_id:
+                    continue
+                text = item.text(strip=True)
+                # Skip fragments, whole-section blobs and repeated entries
+                if len(text) < 6 or len(text) > 500 or text in seen_texts:
+                    continue
+                seen_texts.add(text)
+
+                # Try to split name and description
+                parts = _TOOL_SPLIT.split(text, maxsplit=1)
+                if len(parts) == 2:
+                    name, desc = parts[0].strip(), parts[1].strip()
+                else:
+                    name, desc = text[:50], text
+                if name not in tools:
+                    tools[name] = MCPTool.trusted(name=name, description=desc)
 
         # Also look for bold/strong elements that might be tool names
         if not tools:
-            strong_elements = soup.find_all(["strong", "b"])
+            strong_elements = tree.css("strong, b")
             for elem in strong_elements:
-                name = elem.get_text(strip=True)
+                if len(tools) >= _MAX_TOOLS:
+                    break
+                name = elem.text(strip=True)
                 if name and "_" in name or name.startswith("get") or name.startswith("create"):
-                    next_text = elem.next_sibling
-                    desc = str(next_text).strip() if next_text else ""
-                    tools.append(MCPTool(name=name, description=desc[:200]))
+                    next_node = elem.next
+                    if next_node is None:
+                        desc = ""
+                    elif next_node.tag == "-text":
+                        # .html would keep entities escaped (e.g. "&amp;")
+                        desc = next_node.text_content.strip()
+                    else:
+                        desc = next_node.html.strip()
+                    if name not in tools:
+                        tools[name] = MCPTool.trusted(name=name, description=desc[:200])
 
-        return tools[:20]  # Limit to 20 tools
+        # Names and descriptions are always strings taken from the page
+        return list(tools.values())
 
     def _extract_install_command(
-        self, soup: BeautifulSoup, mcp_name: str
+        self, page_text: str, mcp_name: str
     ) -> tuple[str, list[str]]:
         """Extract installation command and arguments."""
-        # Common patterns for MCP installation
-        patterns = [
-            (r"npx\s+-y\s+([^\s<\"']+)", "npx"),
-            (r"uvx\s+([^\s<\"']+)", "uvx"),
-            (r"bunx\s+([^\s<\"']+)", "bunx"),
-            (r"npm\s+exec\s+([^\s<\"']+)", "npm"),
-        ]
-
-        page_text = soup.get_text()
-
-        for pattern, cmd in patterns:
-            match = re.search(pattern, page_text)
+        for pattern, cmd in _INSTALL_PATTERNS:
+            match = pattern.search(page_text)
             if match:
                 package = match.group(1)
                 if cmd == "npx":
@@ -183,28 +281,20 @@ class FastMCPSource(MCPSource):
         # Default fallback
         return "npx", ["-y", f"mcp-server-{mcp_name.lower()}"]
 
-    def _extract_env_vars(self, soup: BeautifulSoup) -> list[str]:
+    def _extract_env_vars(self, page_text: str) -> list[str]:
         """Extract required environment variables."""
-        env_vars = []
-        page_text = soup.get_text()
-
-        # Common patterns for environment variables
-        env_patterns = [
-            r"\$\{([A-Z][A-Z0-9_]+)\}",  # ${VAR_NAME}
-            r"\$([A-Z][A-Z0-9_]+)",  # $VAR_NAME
-            r"([A-Z][A-Z0-9_]+)=",  # VAR_NAME=
-            r"env[:\s]+([A-Z][A-Z0-9_]+)",  # env: VAR_NAME
-        ]
+        # Ordered set: dedupes in O(1) while keeping first-seen order
+        env_vars: dict[str, None] = {}
+
+        for m in _ENV_UNION.finditer(page_text):
+            match = next(v for v in m.group(*_ENV_GROUPS) if v)
+            if match in env_vars or len(match) <= 3:
+                continue
+            # Filter out common non-env strings
+            lowered = match.lower()
+            if not any(x in lowered for x in _ENV_FORBIDDEN):
+                env_vars[match] = None
+                if len(env_vars) == 10:  # Limit
+                    break
 
-        for pattern in env_patterns:
-            matches = re.findall(pattern, page_text)
-            for match in matches:
-                if match not in env_vars and len(match) > 3:
-                    # Filter out common non-env strings
-                    if not any(
-                        x in match.lower()
-                        for x in ["url", "uri", "http", "json", "xml"]
-                    ):
-                        env_vars.append(match)
-
-        return list(set(env_vars))[:10]  # Dedupe and limit
+        return list(env_vars)
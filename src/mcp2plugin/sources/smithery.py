@@ -1,44 +1,161 @@
 """Smithery.ai source parser."""
 
+import asyncio
 import re
 
 import httpx
-from bs4 import BeautifulSoup
+from cachetools import TTLCache
+from selectolax.lexbor import LexborHTMLParser
 
 from ..models import MCPInfo, MCPTool
-from ..utils.url_parser import SMITHERY_PATTERN
+from ..utils.html import text_nodes
+from ..utils.url_parser import SMITHERY_MARKER, SMITHERY_PATTERN, normalize_url
 from .base import MCPSource
 
+# Elements whose contents are never page text
+_NON_TEXT_TAGS = ["script", "style", "noscript", "template"]
+
+_AUTHOR_RE = re.compile(r"by\s+@?\w+|author", re.I)
+# Elements that usually hold the author, checked before scanning all text
+_AUTHOR_SELECTOR = '[class*=author i], [class*=byline i], [rel=author], a[href*="/u/"]'
+_BYLINE_NAME_RE = re.compile(r"(?:by\s+)?@?(\w+)", re.I)
+# Tool sections are these tags with a class containing one of the keywords
+_TOOL_SECTION_TAGS = frozenset({"div", "section", "ul", "table"})
+_TOOL_SECTION_KEYWORDS = ("tool", "function", "method", "endpoint", "api")
+_TOOL_ITEM_TAGS = frozenset({"li", "tr", "div"})
+_FUNC_CALL_RE = re.compile(r"(\w+)\s*\(")
+# Call-like keywords that are never tool names
+_PY_KEYWORDS = frozenset({"if", "for", "while", "function", "def"})
+_MAX_TOOLS = 20
+_HOSTED_RE = re.compile(r"hosted|remote|cloud|server\.smithery\.ai", re.I)
+_CONFIG_SECTION_TAGS = frozenset({"div", "section", "pre", "code"})
+_CONFIG_SECTION_KEYWORDS = ("config", "env", "setting")
+_QUOTED_VAR_RE = re.compile(r'"([A-Z][A-Z0-9_]+)"')
+
+# Local installation patterns
+_INSTALL_PATTERNS = [
+    (re.compile(r"npx\s+@smithery/cli\s+install\s+([^\s]+)"), "smithery"),
+    (re.compile(r"npx\s+-y\s+([^\s<\"']+)"), "npx"),
+    (re.compile(r"npm\s+install\s+([^\s]+)"), "npm"),
+]
+
+# Common patterns for environment variables, scanned in a single pass
+_ENV_UNION = re.compile(
+    r"\$\{(?P<a>[A-Z][A-Z0-9_]+)\}"  # ${VAR_NAME}
+    r"|(?P<b>[A-Z][A-Z0-9_]+):\s*(?:string|required)"  # VAR_NAME: string
+    r'|"(?P<c>[A-Z][A-Z0-9_]+)":\s*\{'  # "VAR_NAME": {
+)
+_ENV_GROUPS = ("a", "b", "c")
+
+# Schema keywords that look like variable names
+_ENV_FORBIDDEN = frozenset({"type", "string", "number", "boolean"})
+
+# Pages are only read up to this size
+_MAX_PAGE_BYTES = 2_000_000
+
+
+def _split_once(text: str) -> tuple[str, ...]:
+    """Split text at the first "-", "–" or ":" (like a maxsplit=1 regex split)."""
+    best = -1
+    for delim in "-–:":
+        idx = text.find(delim)
+        if idx != -1 and (best == -1 or idx < best):
+            best = idx
+    if best == -1:
+        return (text,)
+    return text[:best], text[best + 1 :]
+
 
 class SmitherySource(MCPSource):
     """Parser for smithery.ai MCP server pages."""
 
+    client_timeout = httpx.Timeout(connect=5.0, read=20.0, write=10.0, pool=5.0)
+    client_limits = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient | None = None,
+        cache_size: int = 256,
+        cache_ttl: float = 300.0,
+    ):
+        """Initialize the source.
+
+        Args:
+            client: HTTP client to fetch pages with. If not provided, one is
+                created on first use and closed by `aclose`.
+            cache_size: Maximum number of parsed pages to keep
+            cache_ttl: Seconds a parsed page stays cached
+        """
+        super().__init__(client)
+        self._cache: TTLCache[str, MCPInfo] = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        # Per-URL locks so concurrent fetches of one page only hit the network
+        # once, and how many fetches hold or wait on each; a lock is dropped
+        # only when that count reaches zero
+        self._cache_locks: dict[str, asyncio.Lock] = {}
+        self._cache_waiters: dict[str, int] = {}
+
+    def clear_cache(self) -> None:
+        """Drop all cached pages."""
+        self._cache.clear()
+
     def can_handle(self, url: str) -> bool:
         """Check if this source can handle the given URL."""
-        return bool(SMITHERY_PATTERN.match(url))
+        # Cheap substring test first; most URLs from other hosts stop here
+        return SMITHERY_MARKER in url and bool(SMITHERY_PATTERN.match(url))
 
     async def fetch(self, url: str) -> MCPInfo:
         """Fetch and parse MCP information from smithery.ai.
 
+        Results are cached by normalized URL for `cache_ttl` seconds.
+
         Args:
             url: The smithery.ai URL
 
         Returns:
             MCPInfo containing the parsed data
         """
+        key = normalize_url(url)
+        info = self._cache.get(key)
+        if info is None:
+            lock = self._cache_locks.get(key)
+            if lock is None:
+                lock = self._cache_locks[key] = asyncio.Lock()
+            waiters = self._cache_waiters
+            waiters[key] = waiters.get(key, 0) + 1
+            try:
+                async with lock:
+                    info = self._cache.get(key)
+                    if info is None:
+                        info = self._cache[key] = await self._fetch_page(url)
+            finally:
+                # lock.locked() is already False when a woken waiter is about
+                # to run, so only the count says whether the lock is unused
+                waiters[key] -= 1
+                if not waiters[key]:
+                    del waiters[key]
+                    del self._cache_locks[key]
+
+        # Callers (e.g. LLM enhancement) mutate the result; keep the cache clean
+        return info.model_copy(deep=True)
+
+    async def _fetch_page(self, url: str) -> MCPInfo:
+        """Fetch and parse a smithery.ai page, bypassing the cache."""
         # Normalize URL (handle server.smithery.ai redirect)
-        if "server.smithery.ai" in url:
-            match = re.search(r"server\.smithery\.ai/([^/\s]+)", url)
-            if match:
-                server_name = match.group(1)
-                url = f"https://smithery.ai/server/{server_name}"
+        url = normalize_url(url)
 
-        async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-            response = await client.get(url)
+        async with self._get_client().stream("GET", url) as response:
             response.raise_for_status()
-
-        html = response.text
-        soup = BeautifulSoup(html, "html.parser")
+            buf = bytearray()
+            async for chunk in response.aiter_bytes():
+                buf.extend(chunk)
+                if len(buf) >= _MAX_PAGE_BYTES:
+                    break
+
+        html = buf.decode(response.encoding or "utf-8", errors="replace")
+        tree = LexborHTMLParser(html)
+        # Script/style contents are not page text (comments never are)
+        tree.strip_tags(_NON_TEXT_TAGS)
+        page_text = tree.text()
 
         # Extract server name from URL
         match = SMITHERY_PATTERN.match(url)
@@ -48,44 +165,48 @@ class SmitherySource(MCPSource):
         server_name = match.group(1)
 
         # Extract title/name from page
-        title_elem = soup.find("h1")
-        display_name = title_elem.get_text(strip=True) if title_elem else server_name
+        title_elem = tree.css_first("h1")
+        display_name = title_elem.text(strip=True) if title_elem else server_name
 
         # Extract description
         description = ""
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc and meta_desc.get("content"):
-            description = meta_desc["content"]
+        meta_desc = tree.css_first('meta[name="description"]')
+        if meta_desc and meta_desc.attributes.get("content"):
+            description = meta_desc.attributes["content"]
         else:
             # Try to find description in page content
-            desc_elem = soup.find("p")
+            desc_elem = tree.css_first("p")
             if desc_elem:
-                description = desc_elem.get_text(strip=True)[:500]
+                description = desc_elem.text(strip=True)[:500]
 
         # Extract author
         author = ""
-        author_elem = soup.find(string=re.compile(r"by\s+@?\w+|author", re.I))
-        if author_elem:
-            author_match = re.search(r"@?(\w+)", str(author_elem))
+        for candidate in tree.css(_AUTHOR_SELECTOR):
+            author_match = _BYLINE_NAME_RE.search(candidate.text(strip=True))
             if author_match:
                 author = author_match.group(1)
+                break
+        else:
+            # Fall back to scanning every string on the page
+            author_text = next((t for t in text_nodes(tree) if _AUTHOR_RE.search(t)), None)
+            if author_text:
+                author_match = _BYLINE_NAME_RE.search(author_text)
+                if author_match:
+                    author = author_match.group(1)
 
-        # Extract tools
-        tools = self._extract_tools(soup)
+        # Extract tools and environment variables
+        tools, env_vars = self._extract_all(tree, page_text)
 
         # Determine connection type and install command
         connection_type, install_command, install_args, http_url = (
-            self._determine_connection(soup, server_name)
+            self._determine_connection(page_text, server_name)
         )
 
-        # Extract environment variables
-        env_vars = self._extract_env_vars(soup)
-
         # Extract homepage
         homepage = None
-        github_link = soup.find("a", href=re.compile(r"github\.com"))
+        github_link = tree.css_first('a[href*="github.com"]')
         if github_link:
-            homepage = github_link.get("href")
+            homepage = github_link.attributes.get("href")
 
         return MCPInfo(
             name=display_name or server_name,
@@ -101,68 +222,106 @@ class SmitherySource(MCPSource):
             source_url=url,
         )
 
-    def _extract_tools(self, soup: BeautifulSoup) -> list[MCPTool]:
-        """Extract tool information from the page."""
-        tools = []
-
-        # Look for tool/function sections
-        tool_sections = soup.find_all(
-            ["div", "section", "ul", "table"],
-            class_=re.compile(r"tool|function|method|endpoint|api", re.I),
-        )
+    def _extract_all(
+        self, tree: LexborHTMLParser, page_text: str
+    ) -> tuple[list[MCPTool], list[str]]:
+        """Extract tools and required environment variables in one DOM walk.
 
-        for section in tool_sections:
-            items = section.find_all(["li", "tr", "div"])
-            for item in items:
-                text = item.get_text(strip=True)
-                if text and len(text) > 5:
-                    parts = re.split(r"[-–:]", text, maxsplit=1)
-                    if len(parts) == 2:
-                        tools.append(MCPTool(name=parts[0].strip(), description=parts[1].strip()))
-                    else:
-                        tools.append(MCPTool(name=text[:50], description=text))
-
-        # Look for code blocks that might contain tool definitions
-        code_blocks = soup.find_all("code")
+        Returns:
+            Tuple of (tools, env_vars)
+        """
+        tools = []
+        seen_names: set[str] = set()
+        config_vars = []
+        code_blocks = []
+        # Bound once; these run for every element on the page
+        append_tool = tools.append
+        add_name = seen_names.add
+        extend_config = config_vars.extend
+        append_code = code_blocks.append
+
+        # traverse() is pre-order, so a parent is always classified before its
+        # children; "inside a tool section" is then one lookup on the parent
+        tool_sections: set[int] = set()
+        in_tool_section: set[int] = set()
+        add_section = tool_sections.add
+        mark_inside = in_tool_section.add
+
+        for node in tree.root.traverse():
+            tag = node.tag
+            node_id = node.mem_id
+            parent = node.parent
+            if parent is not None:
+                parent_id = parent.mem_id
+                if parent_id in tool_sections or parent_id in in_tool_section:
+                    mark_inside(node_id)
+                    # Items of tool/function sections
+                    if tag in _TOOL_ITEM_TAGS and len(tools) < _MAX_TOOLS:
+                        text = node.text(strip=True)
+                        if text and len(text) > 5:
+                            parts = _split_once(text)
+                            if len(parts) == 2:
+                                name, desc = parts[0].strip(), parts[1].strip()
+                            else:
+                                name, desc = text[:50], text
+                            if name not in seen_names:
+                                append_tool(MCPTool(name=name, description=desc))
+                                add_name(name)
+
+            if tag == "code":
+                append_code(node)
+
+            if tag in _TOOL_SECTION_TAGS or tag in _CONFIG_SECTION_TAGS:
+                classes = node.attributes.get("class")
+                if not classes:
+                    continue
+                classes = classes.lower()
+                if tag in _TOOL_SECTION_TAGS and any(
+                    keyword in classes for keyword in _TOOL_SECTION_KEYWORDS
+                ):
+                    add_section(node_id)
+                # Config/env sections list variable names
+                if tag in _CONFIG_SECTION_TAGS and any(
+                    keyword in classes for keyword in _CONFIG_SECTION_KEYWORDS
+                ):
+                    extend_config(_QUOTED_VAR_RE.findall(node.text()))
+
+        # Code blocks that might contain tool definitions come after sections
         for code in code_blocks:
-            text = code.get_text(strip=True)
+            if len(tools) >= _MAX_TOOLS:
+                break
             # Look for function-like names
-            func_matches = re.findall(r"(\w+)\s*\(", text)
-            for func_name in func_matches:
-                if func_name not in ["if", "for", "while", "function", "def"]:
-                    if not any(t.name == func_name for t in tools):
-                        tools.append(MCPTool(name=func_name, description=""))
+            for match in _FUNC_CALL_RE.finditer(code.text(strip=True)):
+                func_name = match.group(1)
+                if func_name in seen_names or func_name in _PY_KEYWORDS:
+                    continue
+                append_tool(MCPTool(name=func_name, description=""))
+                add_name(func_name)
+                if len(tools) >= _MAX_TOOLS:
+                    break
 
-        return tools[:20]
+        return tools, self._extract_env_vars(config_vars, page_text)
 
     def _determine_connection(
-        self, soup: BeautifulSoup, server_name: str
+        self, page_text: str, server_name: str
     ) -> tuple[str, str, list[str], str | None]:
         """Determine connection type and installation details.
 
         Returns:
             Tuple of (connection_type, install_command, install_args, http_url)
         """
-        page_text = soup.get_text()
-
         # Check for hosted/remote server indicators
-        if re.search(r"hosted|remote|cloud|server\.smithery\.ai", page_text, re.I):
+        if _HOSTED_RE.search(page_text):
             # This is likely a hosted server
             http_url = f"https://server.smithery.ai/{server_name}"
             return "http", "", [], http_url
 
         # Check for local installation patterns
-        install_patterns = [
-            (r"npx\s+@smithery/cli\s+install\s+([^\s]+)", "npx"),
-            (r"npx\s+-y\s+([^\s<\"']+)", "npx"),
-            (r"npm\s+install\s+([^\s]+)", "npm"),
-        ]
-
-        for pattern, cmd in install_patterns:
-            match = re.search(pattern, page_text)
+        for pattern, cmd in _INSTALL_PATTERNS:
+            match = pattern.search(page_text)
             if match:
                 package = match.group(1)
-                if cmd == "npx" and "@smithery/cli" in pattern:
+                if cmd == "smithery":
                     return "stdio", "npx", ["-y", "@smithery/cli", "run", package], None
                 elif cmd == "npx":
                     return "stdio", "npx", ["-y", package], None
@@ -172,40 +331,29 @@ class SmitherySource(MCPSource):
         # Default to smithery CLI for local servers
         return "stdio", "npx", ["-y", "@smithery/cli", "run", server_name], None
 
-    def _extract_env_vars(self, soup: BeautifulSoup) -> list[str]:
-        """Extract required environment variables."""
-        env_vars = []
-        page_text = soup.get_text()
-
-        # Look for config/env sections
-        config_sections = soup.find_all(
-            ["div", "section", "pre", "code"],
-            class_=re.compile(r"config|env|setting", re.I),
-        )
+    def _extract_env_vars(self, config_vars: list[str], page_text: str) -> list[str]:
+        """Extract required environment variables.
 
-        for section in config_sections:
-            text = section.get_text()
-            # Extract variable names
-            matches = re.findall(r'"([A-Z][A-Z0-9_]+)"', text)
-            env_vars.extend(matches)
+        ``config_vars`` are the names already found in config/env sections.
+        """
+        env_vars = list(config_vars)
+        append_var = env_vars.append
 
         # Also search entire page for common patterns
-        patterns = [
-            r"\$\{([A-Z][A-Z0-9_]+)\}",
-            r"([A-Z][A-Z0-9_]+):\s*(?:string|required)",
-            r'"([A-Z][A-Z0-9_]+)":\s*\{',
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, page_text)
-            env_vars.extend(matches)
+        for m in _ENV_UNION.finditer(page_text):
+            append_var(next(v for v in m.group(*_ENV_GROUPS) if v))
 
-        # Filter and dedupe
+        # Filter and dedupe, keeping first-seen order
+        seen: set[str] = set()
         filtered = []
-        for var in set(env_vars):
-            if len(var) > 3 and not any(
-                x in var.lower() for x in ["type", "string", "number", "boolean"]
-            ):
+        for var in env_vars:
+            if var in seen or len(var) <= 3:
+                continue
+            seen.add(var)
+            lowered = var.lower()
+            if not any(x in lowered for x in _ENV_FORBIDDEN):
                 filtered.append(var)
+                if len(filtered) == 10:  # Limit
+                    break
 
-        return filtered[:10]
+        return filtered
@@ -1,5 +1,5 @@
 """Utility modules."""
 
-from .url_parser import detect_source, normalize_url
+from .url_parser import detect_source, detect_sources, normalize_url
 
-__all__ = ["detect_source", "normalize_url"]
+__all__ = ["detect_source", "detect_sources", "normalize_url"]
@@ -0,0 +1,21 @@
+"""HTML helpers shared by the source parsers."""
+
+from collections.abc import Iterator
+
+from selectolax.lexbor import LexborHTMLParser
+
+
+def text_nodes(tree: LexborHTMLParser) -> Iterator[str]:
+    """Yield the content of every text node in document order.
+
+    Args:
+        tree: Parsed HTML document
+
+    Returns:
+        Iterator over the text node contents (comments are skipped)
+    """
+    if tree.root is None:
+        return
+    for node in tree.root.traverse(include_text=True):
+        if node.tag == "-text":
+            yield node.text_content
@@ -1,6 +1,7 @@
 """URL parsing and detection utilities."""
 
 import re
+from collections.abc import Iterable
 from enum import Enum
 
 
@@ -15,6 +16,18 @@ class SourceType(Enum):
 # URL patterns for different sources
 FASTMCP_PATTERN = re.compile(r"https?://(?:www\.)?fastmcp\.me/MCP/Details/(\d+)/([^/\s]+)")
 SMITHERY_PATTERN = re.compile(r"https?://(?:server\.)?smithery\.ai/(?:server/)?([^/\s]+)")
+_SERVER_SMITHERY_RE = re.compile(r"server\.smithery\.ai/([^/\s]+)")
+
+# Substrings every match of the patterns above contains; checking them first
+# lets unrelated URLs skip the regex engine entirely
+FASTMCP_MARKER = "fastmcp.me/MCP/Details/"
+SMITHERY_MARKER = "smithery.ai/"
+
+# (marker, pattern, source type), tried in order by detect_source
+_DISPATCH = (
+    (FASTMCP_MARKER, FASTMCP_PATTERN, SourceType.FASTMCP),
+    (SMITHERY_MARKER, SMITHERY_PATTERN, SourceType.SMITHERY),
+)
 
 
 def detect_source(url: str) -> SourceType:
@@ -26,13 +39,35 @@ def detect_source(url: str) -> SourceType:
     Returns:
         SourceType enum indicating the detected source
     """
-    if FASTMCP_PATTERN.match(url):
-        return SourceType.FASTMCP
-    if SMITHERY_PATTERN.match(url):
-        return SourceType.SMITHERY
+    for marker, pattern, source_type in _DISPATCH:
+        if marker in url and pattern.match(url):
+            return source_type
     return SourceType.UNKNOWN
 
 
+def detect_sources(urls: Iterable[str]) -> list[SourceType]:
+    """Detect the source type of many URLs.
+
+    Args:
+        urls: The URLs to analyze
+
+    Returns:
+        SourceType for each URL, in input order
+    """
+    # Bind the match methods once rather than per URL
+    dispatch = [(marker, pattern.match, source_type) for marker, pattern, source_type in _DISPATCH]
+    unknown = SourceType.UNKNOWN
+    results = []
+    for url in urls:
+        for marker, match, source_type in dispatch:
+            if marker in url and match(url):
+                results.append(source_type)
+                break
+        else:
+            results.append(unknown)
+    return results
+
+
 def normalize_url(url: str) -> str:
     """Normalize a URL to its canonical form.
 
@@ -43,10 +78,16 @@ def normalize_url(url: str) -> str:
         Normalized URL string
     """
     # Handle smithery.ai redirects
-    if "server.smithery.ai" in url:
-        match = re.search(r"server\.smithery\.ai/([^/\s]+)", url)
-        if match:
-            server_name = match.group(1)
+    _, sep, rest = url.partition("server.smithery.ai/")
+    if sep:
+        # Server name runs up to the next "/" or whitespace
+        head = rest.split("/", 1)[0]
+        server_name = head.split(maxsplit=1)[0] if head and not head[0].isspace() else ""
+        if not server_name:
+            # Unusual shape (e.g. a later occurrence); let the regex decide
+            match = _SERVER_SMITHERY_RE.search(url)
+            server_name = match.group(1) if match else ""
+        if server_name:
             return f"https://smithery.ai/server/{server_name}"
 
     return url
@@ -62,13 +103,15 @@ def extract_mcp_name(url: str) -> str | None:
         MCP name or None if not found
     """
     # Try fastmcp pattern
-    match = FASTMCP_PATTERN.match(url)
-    if match:
-        return match.group(2)
+    if FASTMCP_MARKER in url:
+        match = FASTMCP_PATTERN.match(url)
+        if match:
+            return match.group(2)
 
     # Try smithery pattern
-    match = SMITHERY_PATTERN.match(url)
-    if match:
-        return match.group(1)
+    if SMITHERY_MARKER in url:
+        match = SMITHERY_PATTERN.match(url)
+        if match:
+            return match.group(1)
 
     return None
@@ -0,0 +1,98 @@
+"""Tests for the conversion orchestrator."""
+
+import asyncio
+
+from mcp2plugin.core.converter import Converter
+from mcp2plugin.models import MCPInfo, MCPTool
+
+URL = "https://smithery.ai/server/slack"
+
+
+class FakeSource:
+    """Source that returns a fixed MCPInfo for any URL."""
+
+    def __init__(self, info: MCPInfo):
+        self.info = info
+
+    def can_handle(self, url: str) -> bool:
+        return True
+
+    async def can_handle_async(self, url: str) -> bool:
+        return True
+
+    async def fetch(self, url: str) -> MCPInfo:
+        return self.info.model_copy(deep=True)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class FakeGeminiParser:
+    """Parser that fills in tools and records what descriptions were built from."""
+
+    def __init__(self, tools: list[MCPTool]):
+        self.tools = tools
+        self.description_tools: list[list[str]] = []
+
+    async def enhance_mcp_info(self, mcp_info: MCPInfo, html_content: str) -> MCPInfo:
+        if not mcp_info.tools:
+            mcp_info.tools = list(self.tools)
+        return mcp_info
+
+    async def generate_plugin_description(
+        self, name, tools, current_description="", service_tier=None
+    ) -> str:
+        names = [t.name for t in tools]
+        self.description_tools.append(names)
+        return f"{name} plugin with tools: {', '.join(names) or 'none'}"
+
+
+def _convert(tmp_path, info: MCPInfo, parser: FakeGeminiParser) -> MCPInfo:
+    converter = Converter(output_dir=tmp_path / "plugins", use_llm=False)
+    converter.use_llm = True
+    converter.gemini_parser = parser
+    converter.sources = [FakeSource(info)]
+
+    async def fetch_html(url: str) -> str:
+        return "<html></html>"
+
+    converted: list[MCPInfo] = []
+
+    async def aadd_plugin(plugin_path, mcp_info: MCPInfo) -> None:
+        converted.append(mcp_info)
+
+    converter._fetch_html = fetch_html
+    converter.marketplace.aadd_plugin = aadd_plugin
+
+    async def run() -> None:
+        async with converter:
+            await converter.convert(URL)
+
+    asyncio.run(run())
+    return converted[0]
+
+
+def test_description_uses_enhanced_tools_when_source_has_none(tmp_path):
+    info = MCPInfo(name="slack", description="Slack", install_command="npx", source_url=URL)
+    parser = FakeGeminiParser([MCPTool(name="send_message"), MCPTool(name="list_channels")])
+
+    result = _convert(tmp_path, info, parser)
+
+    assert parser.description_tools == [["send_message", "list_channels"]]
+    assert result.description == "slack plugin with tools: send_message, list_channels"
+
+
+def test_description_uses_source_tools_when_present(tmp_path):
+    info = MCPInfo(
+        name="slack",
+        description="Slack",
+        tools=[MCPTool(name="send_message")],
+        install_command="npx",
+        source_url=URL,
+    )
+    parser = FakeGeminiParser([MCPTool(name="unused")])
+
+    result = _convert(tmp_path, info, parser)
+
+    assert parser.description_tools == [["send_message"]]
+    assert result.description == "slack plugin with tools: send_message"
@@ -0,0 +1,115 @@
+"""Tests for the smithery.ai source's page cache."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from mcp2plugin.models import MCPInfo
+from mcp2plugin.sources.smithery import SmitherySource
+
+URL = "https://smithery.ai/server/slack"
+
+
+class CountingSource(SmitherySource):
+    """Smithery source whose page fetch is faked and instrumented."""
+
+    def __init__(self, fail: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self.fail = fail
+        self.calls = 0
+        self.running = 0
+        self.peak = 0
+
+    async def _fetch_page(self, url: str) -> MCPInfo:
+        self.calls += 1
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail:
+                raise RuntimeError("fetch failed")
+            return MCPInfo(name="slack", source_url=url)
+        finally:
+            self.running -= 1
+
+
+def test_concurrent_fetches_share_one_request():
+    source = CountingSource()
+
+    async def run() -> list[MCPInfo]:
+        return await asyncio.gather(*(source.fetch(URL) for _ in range(5)))
+
+    results = asyncio.run(run())
+
+    assert source.calls == 1
+    assert all(info.name == "slack" for info in results)
+    # Each caller gets its own copy
+    results[0].name = "changed"
+    assert results[1].name == "slack"
+    assert not source._cache_locks and not source._cache_waiters
+
+
+def test_failed_fetches_never_run_concurrently():
+    source = CountingSource(fail=True)
+
+    async def fetch_after(delay: float) -> MCPInfo:
+        await asyncio.sleep(delay)
+        return await source.fetch(URL)
+
+    async def run() -> list:
+        # Staggered, so later callers arrive while earlier ones are failing
+        return await asyncio.gather(
+            *(fetch_after(i * 0.006) for i in range(5)), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert source.calls == 5
+    assert source.peak == 1
+    assert not source._cache_locks and not source._cache_waiters
+
+
+def test_clear_cache_forces_refetch():
+    source = CountingSource()
+
+    async def run() -> None:
+        await source.fetch(URL)
+        await source.fetch(URL)
+        assert source.calls == 1
+        source.clear_cache()
+        await source.fetch(URL)
+
+    asyncio.run(run())
+
+    assert source.calls == 2
+
+
+def test_failed_fetch_is_not_cached():
+    source = CountingSource(fail=True)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(source.fetch(URL))
+    source.fail = False
+    asyncio.run(source.fetch(URL))
+
+    assert source.calls == 2
+
+
+def _parse(html: str) -> MCPInfo:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text=html))
+
+    async def run() -> MCPInfo:
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await SmitherySource(client=client).fetch(URL)
+
+    return asyncio.run(run())
+
+
+def test_byline_author_from_selector_and_text_fallback():
+    selector = _parse('<html><body><span class="byline">by @bob</span></body></html>')
+    fallback = _parse("<html><body><p>Slack server</p><div>by @bob</div></body></html>")
+
+    assert selector.author == "bob"
+    assert fallback.author == "bob"